@@ -10,13 +10,12 @@ def find_player_mentions_fuzzy(tweet_text, all_player_names, threshold=80):
     matches = process.extract(
         query=tweet_text,
         choices=all_player_names,
-        scorer=fuzz.token_set_ratio
+        scorer=fuzz.token_set_ratio,
+        score_cutoff=threshold,  # Let RapidFuzz drop candidates below threshold
     )
-    
-    print('matches', matches)
-    # Filter by threshold
-    best_matches = [name for name, score, _ in matches if score >= threshold]
-    return list(set(best_matches))  # remove duplicates if any
+
+    best_matches = [name for name, _, _ in matches]
+    return list(dict.fromkeys(best_matches))  # remove duplicates, keep score order
 
 if __name__ == "__main__":
     # Example usage
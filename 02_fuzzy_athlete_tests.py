@@ -1,9 +1,43 @@
 from rapidfuzz import process, fuzz
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import numpy as np
+import sys
 import time
+import unicodedata
+
+
+def fold_text(text):
+    """
+    Returns text with diacritics stripped, so "Jokić" and "Jokic" compare equal.
+    Only combining marks are dropped; letters with no ASCII form are kept.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=None)
+def fold_names(all_player_names):
+    """
+    Fold every player name once per roster; results line up with the roster,
+    so a matched index maps straight back to the original spelling.
+
+    Args:
+        all_player_names (tuple): All player names to match against
+
+    Returns:
+        tuple: The names with diacritics stripped, in roster order
+    """
+    return tuple(fold_text(name) for name in all_player_names)
 
 
 def find_player_mentions_fuzzy(
-    tweet_text, all_player_names, threshold=80, scorer=fuzz.token_set_ratio
+    tweet_text,
+    all_player_names,
+    threshold=80,
+    scorer=fuzz.token_set_ratio,
+    matches=None,
 ):
     """
     Returns a list of possible player name matches from the tweet_text, using
@@ -15,24 +49,149 @@ def find_player_mentions_fuzzy(
         all_player_names (list): List of all player names to match against
         threshold (int): Minimum score (0-100) to consider a match
         scorer (callable): The scorer function to use for matching
+        matches (list): Precomputed matches (e.g. from extract_batch); skips
+            the process.extract call when given, and may include scores below
+            threshold for reporting
 
     Returns:
         list: List of matched player names that meet the threshold
+        list: All (matched_string, score, index) matches
     """
     # process.extract(...) returns a list of tuples: (matched_string, score, index)
-    matches = process.extract(
-        query=tweet_text,
-        choices=all_player_names,
+    if matches is None:
+        matches = process.extract(
+            query=fold_text(tweet_text),
+            choices=fold_names(tuple(all_player_names)),
+            scorer=scorer,
+            processor=None,
+            score_cutoff=threshold,  # Let RapidFuzz drop candidates below threshold
+            limit=10,  # Return top 10 matches for analysis
+        )
+        # Report the original spelling
+        matches = [(all_player_names[idx], score, idx) for _, score, idx in matches]
+
+    # Precomputed matches are uncut, so filter by threshold here
+    best_matches = [name for name, score, _ in matches if score >= threshold]
+    # dict.fromkeys drops duplicates but keeps the descending score order
+    return list(dict.fromkeys(best_matches)), matches
+
+
+def extract_batch(queries, all_player_names, scorer=fuzz.token_set_ratio, limit=10):
+    """
+    Score every query against every player name with a single process.cdist
+    call, instead of one process.extract call per query. No score cutoff is
+    applied, so the top matches below threshold are kept for the report.
+
+    Args:
+        queries (list): The texts to search for player mentions
+        all_player_names (list): List of all player names to match against
+        scorer (callable): The scorer function to use for matching
+        limit (int): Maximum number of matches to keep per query
+
+    Returns:
+        list: One list of (matched_string, score, index) tuples per query,
+            in the same format process.extract returns
+    """
+    scores = process.cdist(
+        [fold_text(query) for query in queries],
+        fold_names(tuple(all_player_names)),
         scorer=scorer,
-        limit=10,  # Return top 10 matches for analysis
+        processor=None,
+        workers=-1,  # Spread the score matrix across all cores
+        dtype=np.float32,  # Fractional scores, as process.extract reports them
     )
 
-    # Filter by threshold
-    best_matches = [name for name, score, _ in matches if score >= threshold]
-    return list(set(best_matches)), matches  # return both matches and filtered results
+    batch = []
+    for row in scores:
+        # Stable sort on descending score keeps ties in choice order, like extract
+        top = np.argsort(-row, kind="stable")[:limit]
+        batch.append([(all_player_names[i], float(row[i]), int(i)) for i in top])
+    return batch
+
+
+# Roster used by _score_one, set once per process by _init_worker
+_worker_players = None
 
 
-def run_test_cases(test_cases, all_players, threshold=80, scorer=fuzz.token_set_ratio):
+def _init_worker(all_players):
+    """
+    Store the roster once per worker process, so it is not pickled per task.
+
+    Args:
+        all_players (tuple): All player names
+    """
+    global _worker_players
+    _worker_players = all_players
+
+
+def _score_one(i, test, threshold, scorer, matches):
+    """
+    Score a single test case; module level so worker processes can run it.
+
+    Args:
+        i (int): 1-based test case number
+        test (dict): The test case dictionary
+        threshold (int): Score threshold for matching
+        scorer (callable): Scoring function to use
+        matches (list): Precomputed matches for this tweet from extract_batch
+
+    Returns:
+        dict: The test case result
+    """
+    tweet = test["tweet"]
+    expected = set(test.get("expected_matches", []))
+
+    start_time = time.perf_counter_ns()
+    matches, all_match_data = find_player_mentions_fuzzy(
+        tweet, _worker_players, threshold, scorer, matches=matches
+    )
+    elapsed = (time.perf_counter_ns() - start_time) / 1e6  # convert to ms
+
+    # Determine if test passed
+    actual_set = set(matches)
+    passed = actual_set == expected
+
+    return {
+        "id": i,
+        "passed": passed,
+        "tweet": tweet,
+        "expected": expected,
+        "actual": actual_set,
+        "all_matches": all_match_data,
+        "elapsed_ms": elapsed,
+    }
+
+
+_ROW_FMT = "  {name:<25} {score:>6.2f}  {idx:>3}  {status}"
+
+
+def _match_status(name, score, result, threshold):
+    """
+    Label one potential match for the results table.
+
+    Args:
+        name (str): The matched player name
+        score (float): The match score
+        result (dict): The test case result the match belongs to
+        threshold (int): Score threshold for matching
+
+    Returns:
+        str: CORRECT MATCH / FALSE POSITIVE when the score meets the
+            threshold, FALSE NEGATIVE when the name was expected but missed it,
+            otherwise empty
+    """
+    if score >= threshold:
+        if name in result["expected"]:
+            return "✓ CORRECT MATCH"
+        return "! FALSE POSITIVE"
+    if name in result["expected"]:
+        return "! FALSE NEGATIVE"
+    return ""
+
+
+def run_test_cases(
+    test_cases, all_players, threshold=80, scorer=fuzz.token_set_ratio, workers=None
+):
     """
     Run a series of test cases and display the results.
 
@@ -41,71 +200,77 @@ def run_test_cases(test_cases, all_players, threshold=80, scorer=fuzz.token_set_
         all_players (list): List of all player names
         threshold (int): Score threshold for matching
         scorer (callable): Scoring function to use
+        workers (int): Number of processes to score test cases in; None or 1
+            scores them in this process, which is faster for small suites
     """
-    print(f"\n{'='*80}")
-    print(
+    # Collect output and write it once, rather than a print() per line
+    lines = []
+    lines.append(f"\n{'='*80}")
+    lines.append(
         f"FUZZY MATCHING TEST RESULTS (Threshold: {threshold}, Scorer: {scorer.__name__})"
     )
-    print(f"{'='*80}")
-
-    results = []
-
-    for i, test in enumerate(test_cases, 1):
-        tweet = test["tweet"]
-        expected = set(test.get("expected_matches", []))
-
-        start_time = time.time()
-        matches, all_match_data = find_player_mentions_fuzzy(
-            tweet, all_players, threshold, scorer
-        )
-        elapsed = (time.time() - start_time) * 1000  # convert to ms
-
-        # Determine if test passed
-        actual_set = set(matches)
-        passed = actual_set == expected
-
-        results.append(
-            {
-                "id": i,
-                "passed": passed,
-                "tweet": tweet,
-                "expected": expected,
-                "actual": actual_set,
-                "all_matches": all_match_data,
-                "elapsed_ms": elapsed,
-            }
-        )
+    lines.append(f"{'='*80}")
+
+    # Score all tweets in one batch; each case is charged an equal share
+    queries = [test["tweet"] for test in test_cases]
+    start_time = time.perf_counter_ns()
+    batch = extract_batch(queries, all_players, scorer)
+    batch_elapsed = (time.perf_counter_ns() - start_time) / 1e6 / max(len(queries), 1)
+
+    score_args = (
+        range(1, len(test_cases) + 1),
+        test_cases,
+        repeat(threshold),
+        repeat(scorer),
+        batch,
+    )
+    if workers and workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(tuple(all_players),),
+        ) as executor:
+            results = list(executor.map(_score_one, *score_args))
+    else:
+        _init_worker(tuple(all_players))
+        results = list(map(_score_one, *score_args))
+
+    for result in results:
+        result["elapsed_ms"] += batch_elapsed
 
     # Display results
     total_passed = sum(1 for r in results if r["passed"])
 
     for i, result in enumerate(results, 1):
-        print(f"\nTest Case #{i}: {'✓ PASSED' if result['passed'] else '✗ FAILED'}")
-        print(f"Tweet: \"{result['tweet']}\"")
-
-        print("\nAll potential matches (Name, Score, Index):")
-        for name, score, idx in result["all_matches"]:
-            match_status = ""
-            if score >= threshold:
-                if name in result["expected"]:
-                    match_status = "✓ CORRECT MATCH"
-                else:
-                    match_status = "! FALSE POSITIVE"
-            elif name in result["expected"]:
-                match_status = "! FALSE NEGATIVE"
-
-            print(f"  {name:<25} {score:>6.2f}  {idx:>3}  {match_status}")
+        lines.append(
+            f"\nTest Case #{i}: {'✓ PASSED' if result['passed'] else '✗ FAILED'}"
+        )
+        lines.append(f"Tweet: \"{result['tweet']}\"")
+
+        lines.append("\nAll potential matches (Name, Score, Index):")
+        lines.extend(
+            _ROW_FMT.format_map(
+                {
+                    "name": name,
+                    "score": score,
+                    "idx": idx,
+                    "status": _match_status(name, score, result, threshold),
+                }
+            )
+            for name, score, idx in result["all_matches"]
+        )
 
         if not result["passed"]:
-            print("\nExpected:", sorted(list(result["expected"])))
-            print("Actual:  ", sorted(list(result["actual"])))
+            lines.append(f"\nExpected: {sorted(result['expected'])}")
+            lines.append(f"Actual:   {sorted(result['actual'])}")
 
-        print(f"Time: {result['elapsed_ms']:.2f}ms")
-        print("-" * 80)
+        lines.append(f"Time: {result['elapsed_ms']:.2f}ms")
+        lines.append("-" * 80)
 
-    print(
+    lines.append(
         f"\nSummary: {total_passed}/{len(results)} tests passed ({total_passed/len(results)*100:.1f}%)"
     )
+    sys.stdout.write("\n".join(lines) + "\n")
     return results
 
 
@@ -239,13 +404,23 @@ if __name__ == "__main__":
     )
     print("-" * 90)
 
+    # Thresholds only filter, so score the tweet once per scorer and reuse it
     for scorer in scorers:
+        start_time = time.perf_counter_ns()
+        row = process.cdist(
+            [fold_text(benchmark_tweet)],
+            fold_names(tuple(all_players)),
+            scorer=scorer,
+            processor=None,
+        )[0]
+        scoring_elapsed = (time.perf_counter_ns() - start_time) / 1e6
+
         for threshold in [50, 70, 90]:
-            start_time = time.time()
-            matches, _ = find_player_mentions_fuzzy(
-                benchmark_tweet, all_players, threshold, scorer
-            )
-            elapsed = (time.time() - start_time) * 1000
+            start_time = time.perf_counter_ns()
+            matches = [
+                name for name, score in zip(all_players, row) if score >= threshold
+            ]
+            elapsed = scoring_elapsed + (time.perf_counter_ns() - start_time) / 1e6
 
             matches_str = str(matches)
             if len(matches_str) > 35:
@@ -1,72 +1,242 @@
 from rapidfuzz import process, fuzz
+from rapidfuzz.distance import Levenshtein
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import heapq
+import numpy as np
+import sys
 import time
 import re
+import unicodedata
 
+WORD_RE = re.compile(r"\b\w+\b")
+MIN_FUZZY_WORD_LEN = 5  # Shorter words/name parts are too easy to misread
 
-def find_player_mentions_fuzzy(
-    tweet_text, all_player_names, threshold=30, scorer=fuzz.token_set_ratio, limit=5
-):
+# Common nicknames for each player
+NICKNAMES = {
+    "LeBron James": ("king", "lbj"),
+    "Giannis Antetokounmpo": ("greek", "freak"),
+    "James Harden": ("beard",),
+    "Kevin Durant": ("kd",),
+}
+
+
+def fold_text(text):
     """
-    Returns a list of possible player name matches from the tweet_text, using
-    fuzzy matching against all_player_names. Matches with a score >= threshold
-    are considered candidates.
+    Returns text with diacritics stripped, so "Jokić" and "Jokic" compare equal.
+    Only combining marks are dropped; letters with no ASCII form are kept.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=None)
+def fold_names(all_player_names):
+    """
+    Fold every player name once per roster; results line up with the roster,
+    so a matched index maps straight back to the original spelling.
 
     Args:
-        tweet_text (str): The text to search for player mentions
+        all_player_names (tuple): All player names to match against
+
+    Returns:
+        tuple: The names with diacritics stripped, in roster order
+    """
+    return tuple(fold_text(name) for name in all_player_names)
+
+
+def char_trigrams(text):
+    """
+    Returns the set of lowercased three-character substrings of text.
+    """
+    lowered = text.lower()
+    return frozenset(lowered[i : i + 3] for i in range(len(lowered) - 2))
+
+
+@lru_cache(maxsize=None)
+def build_trigram_index(all_player_names):
+    """
+    Precompute the character trigrams of each player name.
+
+    Args:
+        all_player_names (tuple): All player names to match against
+
+    Returns:
+        list: One frozenset of trigrams per player name, in roster order
+    """
+    return [char_trigrams(name) for name in fold_names(all_player_names)]
+
+
+@lru_cache(maxsize=None)
+def build_name_parts(all_player_names):
+    """
+    Collect the lowercased parts of each player name that are long enough to
+    fuzzy match against single tweet words.
+
+    Args:
+        all_player_names (tuple): All player names to match against
+
+    Returns:
+        list: Name parts, for scoring with process.extract
+        list: The player name each part belongs to, in the same order
+    """
+    parts, part_players = [], []
+    for name, folded in zip(all_player_names, fold_names(all_player_names)):
+        for part in folded.lower().split():
+            if len(part) >= MIN_FUZZY_WORD_LEN:
+                parts.append(part)
+                part_players.append(name)
+    return parts, part_players
+
+
+def find_misspelled_names(words, all_player_names):
+    """
+    Match tweet words against player name parts within a small edit distance,
+    e.g. "antetokounpo" -> "Giannis Antetokounmpo".
+
+    Each word is scored against every name part in one process.extract call,
+    with the largest edit budget as score_cutoff so RapidFuzz can abandon far
+    pairs early. Survivors must also fit their part's own budget and share its
+    first letter: misspellings rarely change the first letter, and requiring
+    it keeps common words like "games" from matching "james".
+
+    Args:
+        words (iterable): Lowercased tweet words
         all_player_names (list): List of all player names to match against
-        threshold (int): Minimum score (0-100) to consider a match
-        scorer (callable): The scorer function to use for matching
-        limit (int): Maximum number of matches to return
 
     Returns:
-        list: List of matched player names that meet the threshold
+        set: Player names with a name part close to one of the words
     """
-    # First, check for direct name mentions
     matched_players = set()
+    parts, part_players = build_name_parts(tuple(all_player_names))
+
+    for word in words:
+        if len(word) < MIN_FUZZY_WORD_LEN:
+            continue
+        close_parts = process.extract(
+            word,
+            parts,
+            scorer=Levenshtein.distance,
+            score_cutoff=2,
+            limit=None,
+        )
+        for part, edits, i in close_parts:
+            max_edits = 1 if len(part) < 8 else 2
+            if edits <= max_edits and word[0] == part[0]:
+                matched_players.add(part_players[i])
+
+    return matched_players
 
-    # Break tweet into words and check for player last names first
-    words = re.findall(r"\b\w+\b", tweet_text.lower())
 
+@lru_cache(maxsize=None)
+def build_player_index(all_player_names):
+    """
+    Build the lookup of last names, first names, and nicknames to players once
+    per roster, rather than on every matching call.
+
+    Args:
+        all_player_names (tuple): All player names to match against
+
+    Returns:
+        dict: Mapping of lowercased name/nickname to a tuple of player names
+    """
     # Extract last names from player full names
     player_info = {}
-    for name in all_player_names:
-        last_name = name.split()[-1].lower()
+    for name, folded in zip(all_player_names, fold_names(all_player_names)):
+        last_name = folded.split()[-1].lower()
         if last_name not in player_info:
             player_info[last_name] = []
         player_info[last_name].append(name)
 
         # Also handle first names for players like "LeBron" who are known by first name
-        first_name = name.split()[0].lower()
+        first_name = folded.split()[0].lower()
         if first_name not in player_info:
             player_info[first_name] = []
         player_info[first_name].append(name)
 
         # Handle nicknames
-        if name == "LeBron James":
-            player_info["king"] = [name]
-            player_info["lbj"] = [name]
-        elif name == "Giannis Antetokounmpo":
-            player_info["greek"] = [name]
-            player_info["freak"] = [name]
-        elif name == "James Harden":
-            player_info["beard"] = [name]
-        elif name == "Kevin Durant":
-            player_info["kd"] = [name]
+        for nickname in NICKNAMES.get(name, ()):
+            player_info[nickname] = [name]
+
+    # Freeze the lists, since the cached index is shared between calls, and
+    # intern the keys so lookups of equal interned words can skip the compare
+    return {sys.intern(key): tuple(players) for key, players in player_info.items()}
+
+
+def find_player_mentions_fuzzy(
+    tweet_text,
+    all_player_names,
+    threshold=30,
+    scorer=fuzz.token_set_ratio,
+    limit=5,
+    matches=None,
+    min_shared_trigrams=None,
+):
+    """
+    Returns a list of possible player name matches from the tweet_text, using
+    fuzzy matching against all_player_names. Matches with a score >= threshold
+    are considered candidates.
+
+    Args:
+        tweet_text (str): The text to search for player mentions
+        all_player_names (list): List of all player names to match against
+        threshold (int): Minimum score (0-100) to consider a match
+        scorer (callable): The scorer function to use for matching
+        limit (int): Maximum number of matches to return
+        matches (list): Precomputed fuzzy matches (e.g. from extract_batch);
+            skips the process.extract call when given, and may include scores
+            below threshold for reporting
+        min_shared_trigrams (int): Only fuzzy score names sharing at least this
+            many character trigrams with the tweet. Off by default: it is lossy
+            at low thresholds and only pays off on large rosters
+
+    Returns:
+        list: List of matched player names that meet the threshold
+        list: All (matched_string, score, index) fuzzy matches
+    """
+    # First, check for direct name mentions
+    matched_players = set()
+
+    # Strip diacritics once so "Jokic" in a tweet finds "Jokić"; the names
+    # themselves are folded once per roster
+    folded_tweet = fold_text(tweet_text)
+    folded_names = fold_names(tuple(all_player_names))
 
     # First pass: direct word matches for last names, first names, and nicknames
-    for word in words:
+    player_info = build_player_index(tuple(all_player_names))
+    unmatched_words = []
+    for word in WORD_RE.findall(folded_tweet.lower()):
         if word in player_info:
-            for player in player_info[word]:
-                matched_players.add(player)
+            matched_players.update(player_info[word])
+        else:
+            unmatched_words.append(word)
+
+    # Catch misspelled names that the exact lookup misses (e.g. "Antetokounpo")
+    matched_players.update(find_misspelled_names(unmatched_words, all_player_names))
 
     # Second pass: fuzzy match on the entire text
     # process.extract(...) returns a list of tuples: (matched_string, score, index)
-    matches = process.extract(
-        query=tweet_text,
-        choices=all_player_names,
-        scorer=scorer,
-        limit=10,  # Return top 10 matches for analysis
-    )
+    if matches is None:
+        choices = folded_names
+        if min_shared_trigrams:
+            # A dict of index -> name makes extract report the roster index
+            tweet_trigrams = char_trigrams(folded_tweet)
+            player_trigrams = build_trigram_index(tuple(all_player_names))
+            choices = {
+                i: name
+                for i, name in enumerate(folded_names)
+                if len(tweet_trigrams & player_trigrams[i]) >= min_shared_trigrams
+            }
+        matches = process.extract(
+            query=folded_tweet,
+            choices=choices,
+            scorer=scorer,
+            processor=None,
+            limit=10,  # Return top 10 matches for analysis
+        )
+        # Report the original spelling
+        matches = [(all_player_names[idx], score, idx) for _, score, idx in matches]
 
     # Add players that match above threshold
     for name, score, _ in matches:
@@ -74,25 +244,140 @@ def find_player_mentions_fuzzy(
             matched_players.add(name)
 
     # Return top matches, prioritizing higher scores
-    sorted_matches = sorted(
-        [
-            (
-                name,
-                process.extract(query=name, choices=[tweet_text], scorer=scorer)[0][1],
-            )
-            for name in matched_players
-        ],
-        key=lambda x: x[1],
-        reverse=True,
+    # Score only the candidates, tweet first as in the fuzzy pass; direct word
+    # matches can score below threshold, so no score_cutoff here or they
+    # would all tie at 0
+    candidates = [
+        i for i, name in enumerate(all_player_names) if name in matched_players
+    ]
+    # nlargest is stable, so equal scores keep roster order
+    top = heapq.nlargest(
+        limit, candidates, key=lambda i: scorer(folded_tweet, folded_names[i])
     )
 
     # Return the top N matches (or fewer if there aren't enough)
-    result = [name for name, _ in sorted_matches[:limit]]
+    result = [all_player_names[i] for i in top]
     return result, matches
 
 
+def extract_batch(queries, all_player_names, scorer=fuzz.token_set_ratio, limit=10):
+    """
+    Score every query against every player name with a single process.cdist
+    call, instead of one process.extract call per query. No score cutoff is
+    applied, so the top matches below threshold are kept for the report.
+
+    Args:
+        queries (list): The texts to search for player mentions
+        all_player_names (list): List of all player names to match against
+        scorer (callable): The scorer function to use for matching
+        limit (int): Maximum number of matches to keep per query
+
+    Returns:
+        list: One list of (matched_string, score, index) tuples per query,
+            in the same format process.extract returns
+    """
+    scores = process.cdist(
+        [fold_text(query) for query in queries],
+        fold_names(tuple(all_player_names)),
+        scorer=scorer,
+        processor=None,
+        workers=-1,  # Spread the score matrix across all cores
+        dtype=np.float32,  # Fractional scores, as process.extract reports them
+    )
+
+    batch = []
+    for row in scores:
+        # Stable sort on descending score keeps ties in choice order, like extract
+        top = np.argsort(-row, kind="stable")[:limit]
+        batch.append([(all_player_names[i], float(row[i]), int(i)) for i in top])
+    return batch
+
+
+# Roster used by _score_one, set once per process by _init_worker
+_worker_players = None
+
+
+def _init_worker(all_players):
+    """
+    Store the roster once per worker process, so it is not pickled per task.
+
+    Args:
+        all_players (tuple): All player names
+    """
+    global _worker_players
+    _worker_players = all_players
+
+
+def _score_one(i, test, threshold, scorer, limit, matches):
+    """
+    Score a single test case; module level so worker processes can run it.
+
+    Args:
+        i (int): 1-based test case number
+        test (dict): The test case dictionary
+        threshold (int): Score threshold for matching
+        scorer (callable): Scoring function to use
+        limit (int): Maximum number of matches to return
+        matches (list): Precomputed matches for this tweet from extract_batch
+
+    Returns:
+        dict: The test case result
+    """
+    tweet = test["tweet"]
+    expected = set(test.get("expected_matches", []))
+
+    start_time = time.perf_counter_ns()
+    matches, all_match_data = find_player_mentions_fuzzy(
+        tweet, _worker_players, threshold, scorer, limit, matches=matches
+    )
+    elapsed = (time.perf_counter_ns() - start_time) / 1e6  # convert to ms
+
+    # Determine if test passed
+    actual_set = set(matches)
+    passed = all(name in actual_set for name in expected)
+
+    return {
+        "id": i,
+        "passed": passed,
+        "tweet": tweet,
+        "expected": expected,
+        "actual": actual_set,
+        "all_matches": all_match_data,
+        "elapsed_ms": elapsed,
+    }
+
+
+_ROW_FMT = "  {name:<25} {score:>6.2f}  {idx:>3}  {status}"
+
+
+def _match_status(name, result):
+    """
+    Label one potential match for the results table.
+
+    Args:
+        name (str): The matched player name
+        result (dict): The test case result the match belongs to
+
+    Returns:
+        str: CORRECT MATCH / FALSE POSITIVE when the name was returned as a
+            match, FALSE NEGATIVE when it was expected but not, otherwise empty
+    """
+    if name in result["actual"]:
+        if name in result["expected"]:
+            return "✓ CORRECT MATCH"
+        return "! FALSE POSITIVE"
+    if name in result["expected"]:
+        return "! FALSE NEGATIVE"
+    return ""
+
+
 def run_test_cases(
-    test_cases, all_players, threshold=30, scorer=fuzz.token_set_ratio, limit=5
+    test_cases,
+    all_players,
+    threshold=30,
+    scorer=fuzz.token_set_ratio,
+    limit=5,
+    workers=None,
 ):
     """
     Run a series of test cases and display the results.
@@ -103,71 +388,78 @@ def run_test_cases(
         threshold (int): Score threshold for matching
         scorer (callable): Scoring function to use
         limit (int): Maximum number of matches to return
+        workers (int): Number of processes to score test cases in; None or 1
+            scores them in this process, which is faster for small suites
     """
-    print(f"\n{'='*80}")
-    print(
+    # Collect output and write it once, rather than a print() per line
+    lines = []
+    lines.append(f"\n{'='*80}")
+    lines.append(
         f"FUZZY MATCHING TEST RESULTS (Threshold: {threshold}, Scorer: {scorer.__name__}, Limit: {limit})"
     )
-    print(f"{'='*80}")
-
-    results = []
-
-    for i, test in enumerate(test_cases, 1):
-        tweet = test["tweet"]
-        expected = set(test.get("expected_matches", []))
-
-        start_time = time.time()
-        matches, all_match_data = find_player_mentions_fuzzy(
-            tweet, all_players, threshold, scorer, limit
-        )
-        elapsed = (time.time() - start_time) * 1000  # convert to ms
-
-        # Determine if test passed
-        actual_set = set(matches)
-        passed = all(name in actual_set for name in expected)
-
-        results.append(
-            {
-                "id": i,
-                "passed": passed,
-                "tweet": tweet,
-                "expected": expected,
-                "actual": actual_set,
-                "all_matches": all_match_data,
-                "elapsed_ms": elapsed,
-            }
-        )
+    lines.append(f"{'='*80}")
+
+    # Score all tweets in one batch; each case is charged an equal share
+    queries = [test["tweet"] for test in test_cases]
+    start_time = time.perf_counter_ns()
+    batch = extract_batch(queries, all_players, scorer)
+    batch_elapsed = (time.perf_counter_ns() - start_time) / 1e6 / max(len(queries), 1)
+
+    score_args = (
+        range(1, len(test_cases) + 1),
+        test_cases,
+        repeat(threshold),
+        repeat(scorer),
+        repeat(limit),
+        batch,
+    )
+    if workers and workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(tuple(all_players),),
+        ) as executor:
+            results = list(executor.map(_score_one, *score_args))
+    else:
+        _init_worker(tuple(all_players))
+        results = list(map(_score_one, *score_args))
+
+    for result in results:
+        result["elapsed_ms"] += batch_elapsed
 
     # Display results
     total_passed = sum(1 for r in results if r["passed"])
 
     for i, result in enumerate(results, 1):
-        print(f"\nTest Case #{i}: {'✓ PASSED' if result['passed'] else '✗ FAILED'}")
-        print(f"Tweet: \"{result['tweet']}\"")
-
-        print("\nAll potential matches (Name, Score, Index):")
-        for name, score, idx in result["all_matches"]:
-            match_status = ""
-            if name in result["actual"]:
-                if name in result["expected"]:
-                    match_status = "✓ CORRECT MATCH"
-                else:
-                    match_status = "! FALSE POSITIVE"
-            elif name in result["expected"]:
-                match_status = "! FALSE NEGATIVE"
-
-            print(f"  {name:<25} {score:>6.2f}  {idx:>3}  {match_status}")
+        lines.append(
+            f"\nTest Case #{i}: {'✓ PASSED' if result['passed'] else '✗ FAILED'}"
+        )
+        lines.append(f"Tweet: \"{result['tweet']}\"")
+
+        lines.append("\nAll potential matches (Name, Score, Index):")
+        lines.extend(
+            _ROW_FMT.format_map(
+                {
+                    "name": name,
+                    "score": score,
+                    "idx": idx,
+                    "status": _match_status(name, result),
+                }
+            )
+            for name, score, idx in result["all_matches"]
+        )
 
         if not result["passed"]:
-            print("\nExpected:", sorted(list(result["expected"])))
-            print("Actual:  ", sorted(list(result["actual"])))
+            lines.append(f"\nExpected: {sorted(result['expected'])}")
+            lines.append(f"Actual:   {sorted(result['actual'])}")
 
-        print(f"Time: {result['elapsed_ms']:.2f}ms")
-        print("-" * 80)
+        lines.append(f"Time: {result['elapsed_ms']:.2f}ms")
+        lines.append("-" * 80)
 
-    print(
+    lines.append(
         f"\nSummary: {total_passed}/{len(results)} tests passed ({total_passed/len(results)*100:.1f}%)"
     )
+    sys.stdout.write("\n".join(lines) + "\n")
     return results
 
 
@@ -204,6 +496,8 @@ if __name__ == "__main__":
         "Klay Thompson",
         "Ben Simmons",
     ]
+    # Interned names let the set/dict work on them short-circuit on identity
+    all_players = tuple(sys.intern(name) for name in all_players)
 
     # Test cases with expected matches
     test_cases = [
@@ -298,11 +592,11 @@ if __name__ == "__main__":
     print(f'\nBenchmark tweet: "{test_tweet}"')
     print(f"Expected matches: {expected}")
 
-    start_time = time.time()
+    start_time = time.perf_counter_ns()
     matches, all_match_data = find_player_mentions_fuzzy(
         test_tweet, all_players, threshold=30, scorer=fuzz.token_set_ratio
     )
-    elapsed = (time.time() - start_time) * 1000
+    elapsed = (time.perf_counter_ns() - start_time) / 1e6
 
     print(f"\nMatches found: {matches}")
     print(f"Time taken: {elapsed:.2f}ms")
@@ -1,6 +1,188 @@
 from rapidfuzz import process, fuzz
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+import numpy as np
+import sys
 import time
 import re
+import unicodedata
+
+# Match scores are held as int16 centipoints: 1/100 of a point keeps fuzzy
+# scores like 58.82 apart, and the highest boosted score (about 15000) fits
+_SCORE_SCALE = 100
+
+# Words of a lowercased tweet, compiled once rather than on every call
+_WORD_RE = re.compile(r"\b\w+\b")
+
+# Common nicknames and abbreviations for each player
+_NICKNAME_TABLE = {
+    "LeBron James": ("king", "lebron", "lbj", "king james"),
+    "Giannis Antetokounmpo": ("greek", "freak", "greek freak", "giannis"),
+    "James Harden": ("beard", "the beard"),
+    "Kevin Durant": ("kd", "slim reaper", "durantula"),
+    "Stephen Curry": ("steph", "chef curry"),
+    "Anthony Davis": ("ad", "the brow"),
+    "Luka Dončić": ("luka", "wonder boy", "doncic"),
+    "Russell Westbrook": ("russ", "brodie", "westbrook"),
+    "Jimmy Butler": ("jimmy buckets",),
+    "Kyrie Irving": ("kyrie", "uncle drew"),
+}
+
+
+def fold_text(text):
+    """
+    Returns text with diacritics stripped, so "Jokić" and "Jokic" compare equal.
+    Only combining marks are dropped; letters with no ASCII form are kept.
+    """
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=None)
+def fold_names(all_player_names):
+    """
+    Fold every player name once per roster; results line up with the roster,
+    so a matched index maps straight back to the original spelling.
+
+    Args:
+        all_player_names (tuple): All player names to match against
+
+    Returns:
+        tuple: The names with diacritics stripped, in roster order
+    """
+    return tuple(fold_text(name) for name in all_player_names)
+
+
+@lru_cache(maxsize=None)
+def build_player_index(all_player_names):
+    """
+    Build the name and nickname lookups for a roster. Cached, so repeated
+    calls with the same roster reuse one index.
+
+    Args:
+        all_player_names (tuple): All player names to match against
+
+    Returns:
+        dict: Mapping of lowercased first/last name to matching player ids
+            (indexes into all_player_names)
+        dict: Mapping of nickname to matching player ids
+        np.ndarray: Last-name group id per player id
+    """
+    # Split each name once; everything below indexes these by player id
+    folded_names = fold_names(all_player_names)
+    first_of = tuple(name.split()[0].lower() for name in folded_names)
+    last_of = tuple(name.split()[-1].lower() for name in folded_names)
+
+    # Map last and first names to player ids
+    player_info = {}
+    for pid, (first_name, last_name) in enumerate(zip(first_of, last_of)):
+        player_info.setdefault(last_name, []).append(pid)
+        player_info.setdefault(first_name, []).append(pid)
+
+    # Walk the nickname table rather than the roster; a nickname shared by
+    # several players maps to all of them
+    pid_of = {name: pid for pid, name in enumerate(all_player_names)}
+    nicknames = {}
+    for name, aliases in _NICKNAME_TABLE.items():
+        if name in pid_of:
+            for nickname in aliases:
+                nicknames[nickname] = nicknames.get(nickname, ()) + (pid_of[name],)
+
+    # Players sharing a last name share a group id
+    last_name_groups = {}
+    last_name_ids = np.array(
+        [
+            last_name_groups.setdefault(last_name, len(last_name_groups))
+            for last_name in last_of
+        ],
+        dtype=np.intp,
+    )
+    return player_info, nicknames, last_name_ids
+
+
+def build_player_team_ids(all_player_names, player_teams, team_info):
+    """
+    Intern each player's team code to a small int, so team checks are array
+    loads instead of string lookups.
+
+    Args:
+        all_player_names (list): List of all player names, indexed by id
+        player_teams (dict): Mapping of player names to their team codes
+        team_info (dict): Information about teams
+
+    Returns:
+        np.ndarray: Team id per player id, -1 for players without a team
+        dict: Mapping of team code to team id, covering every code in
+            team_info and player_teams
+    """
+    team_ids = {team_code: i for i, team_code in enumerate(team_info)}
+    team_of = np.array(
+        [
+            (
+                team_ids.setdefault(player_teams[name], len(team_ids))
+                if name in player_teams
+                else -1
+            )
+            for name in all_player_names
+        ],
+        dtype=np.int16,
+    )
+    return team_of, team_ids
+
+
+def _apply_team_context(
+    scores,
+    matched_ids,
+    last_name_ids,
+    team_of,
+    mentioned_mask,
+    team_boost=20,
+    sibling_boost=30,
+    sibling_penalty=10,
+):
+    """
+    Adjust match scores in place using the teams mentioned in the tweet.
+
+    Players on a mentioned team get team_boost. When several matches share a
+    last name, the one on a mentioned team gets sibling_boost on top, and each
+    one on another team loses sibling_penalty per namesake.
+
+    Args:
+        scores (np.ndarray): Score per player id, in centipoints
+        matched_ids (np.ndarray): Ids of the matched players
+        last_name_ids (np.ndarray): Last-name group id per player id, from
+            build_player_index
+        team_of (np.ndarray): Team id per player id, from
+            build_player_team_ids
+        mentioned_mask (np.ndarray): True for each mentioned team id; its
+            last slot stays False so team id -1 never counts as mentioned
+        team_boost (int): Boost, in points, for players on a mentioned team
+        sibling_boost (int): Extra boost, in points, for the namesake on a
+            mentioned team
+        sibling_penalty (int): Penalty, in points, per namesake for players
+            on other teams
+    """
+    if not mentioned_mask.any():
+        return
+
+    teams = team_of[matched_ids]
+    on_team = mentioned_mask[teams]
+    scores[matched_ids[on_team]] += team_boost * _SCORE_SCALE
+
+    if len(matched_ids) < 2:
+        return
+
+    # Namesakes per match from the precomputed last-name groups
+    groups = last_name_ids[matched_ids]
+    namesakes = np.bincount(groups)[groups] - 1
+
+    boosted = (namesakes > 0) & on_team
+    penalized = (namesakes > 0) & ~on_team & (teams >= 0)
+    scores[matched_ids[boosted]] += sibling_boost * _SCORE_SCALE
+    scores[matched_ids[penalized]] -= (
+        sibling_penalty * _SCORE_SCALE * namesakes[penalized]
+    )
 
 
 def find_player_mentions_fuzzy(
@@ -11,6 +193,10 @@ def find_player_mentions_fuzzy(
     threshold=30,
     scorer=fuzz.token_set_ratio,
     limit=5,
+    player_index=None,
+    matches=None,
+    team_index=None,
+    player_team_ids=None,
 ):
     """
     Returns a list of possible player name matches from the tweet_text, using
@@ -24,194 +210,218 @@ def find_player_mentions_fuzzy(
         threshold (int): Minimum score (0-100) to consider a match
         scorer (callable): The scorer function to use for matching
         limit (int): Maximum number of matches to return
+        player_index (tuple): Prebuilt name and nickname lookups from
+            build_player_index; built (and cached) from all_player_names if
+            not given
+        matches (list): Precomputed top fuzzy matches for this tweet (e.g.
+            from extract_batch); skips the process.extract call when given
+        team_index (dict): Prebuilt team aliases from build_team_index
+        player_team_ids (tuple): Prebuilt (team_of, team_ids) from
+            build_player_team_ids; built from player_teams if not given
 
     Returns:
         list: List of matched player names that meet the threshold
         list: All potential matches with scores
     """
+    # Fold and lowercase once; the team and word lookups below share the copy,
+    # and the fuzzy pass reuses the folded text
+    folded_tweet = fold_text(tweet_text)
+    lower_tweet = folded_tweet.lower()
+
     # First, check for teams mentioned in the tweet
-    mentioned_teams = find_team_mentions(tweet_text, team_info)
+    mentioned_teams = find_team_mentions(
+        tweet_text, team_info, team_index, lower_tweet=lower_tweet
+    )
+
+    # Mentioned teams as a mask over team ids
+    if player_team_ids is None:
+        player_team_ids = build_player_team_ids(
+            all_player_names, player_teams, team_info
+        )
+    team_of, team_ids = player_team_ids
+    mentioned_mask = np.zeros(len(team_ids) + 1, dtype=bool)
+    mentioned_mask[[team_ids[team_code] for team_code in mentioned_teams]] = True
     team_boost = 20  # Score boost for players on mentioned teams
 
-    # Initialize for player matching
-    matched_players = set()
-    player_scores = {}
+    # Initialize for player matching: one centipoint score slot per player id
+    scores = np.zeros(len(all_player_names), dtype=np.int16)
+    matched = np.zeros(len(all_player_names), dtype=bool)
 
     # Break tweet into words and check for player last names first
-    words = re.findall(r"\b\w+\b", tweet_text.lower())
+    words = _WORD_RE.findall(lower_tweet)
 
-    # Extract last names from player full names and build nickname dictionary
-    player_info = {}
-    nicknames = {}
+    # Name and nickname lookups are built once per roster, not per tweet
+    if player_index is None:
+        player_index = build_player_index(tuple(all_player_names))
+    player_info, nicknames, last_name_ids = player_index
+
+    # Set operations replace a per-word loop: words that are player names,
+    # and consecutive word pairs that are nicknames (e.g. "King, James")
+    name_words = player_info.keys() & words
+    pairs = set(map(" ".join, zip(words, words[1:])))
 
-    for name in all_player_names:
-        # Handle last names
-        last_name = name.split()[-1].lower()
-        if last_name not in player_info:
-            player_info[last_name] = []
-        player_info[last_name].append(name)
-
-        # Handle first names
-        first_name = name.split()[0].lower()
-        if first_name not in player_info:
-            player_info[first_name] = []
-        player_info[first_name].append(name)
-
-        # Add common nicknames and abbreviations
-        if name == "LeBron James":
-            nicknames["king"] = [name]
-            nicknames["lebron"] = [name]
-            nicknames["lbj"] = [name]
-            nicknames["king james"] = [name]
-        elif name == "Giannis Antetokounmpo":
-            nicknames["greek"] = [name]
-            nicknames["freak"] = [name]
-            nicknames["greek freak"] = [name]
-            nicknames["giannis"] = [name]
-        elif name == "James Harden":
-            nicknames["beard"] = [name]
-            nicknames["the beard"] = [name]
-        elif name == "Kevin Durant":
-            nicknames["kd"] = [name]
-            nicknames["slim reaper"] = [name]
-            nicknames["durantula"] = [name]
-        elif name == "Stephen Curry":
-            nicknames["steph"] = [name]
-            nicknames["chef curry"] = [name]
-        elif name == "Anthony Davis":
-            nicknames["ad"] = [name]
-            nicknames["the brow"] = [name]
-        elif name == "Luka Dončić":
-            nicknames["luka"] = [name]
-            nicknames["wonder boy"] = [name]
-            nicknames["doncic"] = [name]
-        elif name == "Russell Westbrook":
-            nicknames["russ"] = [name]
-            nicknames["brodie"] = [name]
-            nicknames["westbrook"] = [name]
-        elif name == "Jimmy Butler":
-            nicknames["jimmy buckets"] = [name]
-        elif name == "Kyrie Irving":
-            nicknames["kyrie"] = [name]
-            nicknames["uncle drew"] = [name]
-
-    # Look for nickname matches in the tweet
-    for nickname, players in nicknames.items():
-        if nickname in tweet_text.lower():
-            for player in players:
-                matched_players.add(player)
-                player_scores[player] = 90  # High confidence for nickname matches
-
-    # Look for words that match player names
-    for word in words:
-        if word in player_info:
-            for player in player_info[word]:
-                matched_players.add(player)
-                player_scores[player] = player_scores.get(
-                    player, 80
-                )  # High confidence for direct matches
-
-    # Look for consecutive words that match player names
-    for i in range(len(words) - 1):
-        two_words = words[i] + " " + words[i + 1]
-        if two_words in nicknames:
-            for player in nicknames[two_words]:
-                matched_players.add(player)
-                player_scores[player] = 90
+    # Nicknames anywhere in the tweet, checked once each
+    nickname_hits = {nickname for nickname in nicknames if nickname in lower_tweet}
+    nickname_hits |= nicknames.keys() & pairs
+
+    name_ids = [pid for word in name_words for pid in player_info[word]]
+    nickname_ids = [pid for nickname in nickname_hits for pid in nicknames[nickname]]
+
+    # High confidence for direct matches, higher still for nicknames
+    scores[name_ids] = 80 * _SCORE_SCALE
+    scores[nickname_ids] = 90 * _SCORE_SCALE
+    matched[name_ids] = True
+    matched[nickname_ids] = True
 
     # Second pass: fuzzy match on the entire text
-    all_matches = process.extract(
-        query=tweet_text, choices=all_player_names, scorer=scorer, limit=10
-    )
-    # print(all_matches)
-
-    # Add players that match above threshold from fuzzy matching
-    for name, score, _ in all_matches:
-        if score >= threshold:
-            matched_players.add(name)
-            # If already matched by a direct name, keep the higher score
-            player_scores[name] = max(player_scores.get(name, 0), score)
-
-    # Apply team context boost
-    if mentioned_teams:
-        for player in matched_players:
-            if player in player_teams:
-                player_team = player_teams[player]
-                if player_team in mentioned_teams:
-                    player_scores[player] += team_boost
-
-    # Sort by confidence score
-    sorted_matches = sorted(
-        [(name, player_scores.get(name, 0)) for name in matched_players],
-        key=lambda x: x[1],
-        reverse=True,
+    all_matches = matches
+    if all_matches is None:
+        all_matches = process.extract(
+            query=folded_tweet,
+            choices=fold_names(tuple(all_player_names)),
+            scorer=scorer,
+            processor=None,
+            limit=10,  # Uncut, so near misses still show in the report
+        )
+        # Report matches under the original spelling
+        all_matches = [
+            (all_player_names[pid], score, pid) for _, score, pid in all_matches
+        ]
+
+    # Add players that match above threshold from fuzzy matching, rounded to
+    # centipoints for the int16 score slots
+    fuzzy_ids = [pid for _, score, pid in all_matches if score >= threshold]
+    fuzzy_scores = np.rint(
+        [score * _SCORE_SCALE for _, score, _ in all_matches if score >= threshold]
+    ).astype(np.int16)
+    matched[fuzzy_ids] = True
+    # If already matched by a direct name, keep the higher score
+    scores[fuzzy_ids] = np.maximum(scores[fuzzy_ids], fuzzy_scores)
+
+    # Apply team context boost and resolve namesakes
+    matched_ids = np.flatnonzero(matched)
+    _apply_team_context(
+        scores,
+        matched_ids,
+        last_name_ids,
+        team_of,
+        mentioned_mask,
+        team_boost,
     )
 
-    # Handle ambiguous cases (like "James" which could be LeBron or Harden)
-    # If team context is available, use it to resolve
-    if len(sorted_matches) > 1 and mentioned_teams:
-        for i, (player, score) in enumerate(sorted_matches):
-            # Check if this is an ambiguous case (e.g., same last name)
-            same_name_players = []
-            last_name = player.split()[-1].lower()
-
-            for other_player, other_score in sorted_matches:
-                if (
-                    other_player != player
-                    and other_player.split()[-1].lower() == last_name
-                ):
-                    same_name_players.append(other_player)
-
-            if same_name_players:
-                # If player's team is mentioned, boost their score significantly
-                if player in player_teams and player_teams[player] in mentioned_teams:
-                    player_scores[player] += 30
-
-                # Also decrease score of other players with same last name if their team isn't mentioned
-                for other_player in same_name_players:
-                    if (
-                        other_player in player_teams
-                        and player_teams[other_player] not in mentioned_teams
-                    ):
-                        player_scores[other_player] -= 10
-
-        # Re-sort after adjusting scores
-        sorted_matches = sorted(
-            [(name, player_scores.get(name, 0)) for name in matched_players],
-            key=lambda x: x[1],
-            reverse=True,
-        )
+    # Only the best `limit` matches need ordering: partition them out first,
+    # taking tied scores at the cut in roster order
+    top = matched_ids
+    if len(top) > limit > 0:
+        top_scores = scores[top]
+        cutoff = np.partition(top_scores, -limit)[-limit]
+        above = top[top_scores > cutoff]
+        tied = top[top_scores == cutoff][: limit - len(above)]
+        top = np.concatenate((above, tied))
+
+    # Sort by confidence score; ties keep roster order
+    top = top[np.argsort(-scores[top], kind="stable")][:limit]
 
     # Return the top matches limited by the limit parameter
-    result = [name for name, _ in sorted_matches[:limit]]
+    result = [all_player_names[pid] for pid in top]
     return result, all_matches
 
 
-def find_team_mentions(tweet_text, team_info):
+def extract_batch(queries, all_player_names, scorer=fuzz.token_set_ratio, limit=10):
+    """
+    Score every query against every player name with a single process.cdist
+    call, instead of one process.extract call per query. No score cutoff is
+    applied, so the top matches below threshold are kept for the report.
+
+    Args:
+        queries (list): The tweets to search for player mentions
+        all_player_names (list): List of all player names to match against
+        scorer (callable): The scorer function to use for matching
+        limit (int): Maximum number of matches to keep per query
+
+    Returns:
+        list: One list of (matched_string, score, index) tuples per query,
+            in the same format process.extract returns
+    """
+    scores = process.cdist(
+        [fold_text(query) for query in queries],
+        fold_names(tuple(all_player_names)),
+        scorer=scorer,
+        processor=None,
+        workers=-1,  # Spread the score matrix across all cores
+        dtype=np.float32,  # Keep fractional scores for the team boosts
+    )
+
+    # One stable sort over the whole matrix picks every row's top matches;
+    # ties stay in choice order, like extract
+    top = np.argsort(-scores, axis=1, kind="stable")[:, :limit]
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    return [
+        [(all_player_names[i], score, i) for i, score in zip(ids, row)]
+        for ids, row in zip(top.tolist(), top_scores.tolist())
+    ]
+
+
+def build_team_index(team_info):
+    """
+    Fold and lowercase every team alias (full name, location, nickname, code
+    and alternates) once, so callers can reuse it across tweets.
+
+    Args:
+        team_info (dict): Dictionary of team information
+
+    Returns:
+        dict: Mapping of team code to its (full_name, location, other
+            aliases), folded and lowercased
+    """
+    team_aliases = {}
+    for team_code, info in team_info.items():
+        # Folded like the tweet, so accented aliases still line up
+        others = tuple(
+            fold_text(alias).lower()
+            for alias in (info["nickname"], team_code, *info.get("alternates", []))
+        )
+        team_aliases[team_code] = (
+            fold_text(info["full_name"]).lower(),
+            fold_text(info["location"]).lower(),
+            others,
+        )
+    return team_aliases
+
+
+def find_team_mentions(tweet_text, team_info, team_index=None, lower_tweet=None):
     """
     Find mentions of NBA teams in the tweet text.
 
     Args:
         tweet_text (str): The tweet text to analyze
         team_info (dict): Dictionary of team information
+        team_index (dict): Prebuilt aliases from build_team_index; built
+            from team_info if not given
+        lower_tweet (str): tweet_text already folded and lowercased, if the
+            caller has it
 
     Returns:
         list: List of team codes found in the tweet
     """
+    if team_index is None:
+        team_index = build_team_index(team_info)
+
     mentioned_teams = set()
-    lower_tweet = tweet_text.lower()
+    if lower_tweet is None:
+        lower_tweet = fold_text(tweet_text).lower()
 
     # Check for each team's various names
-    for team_code, info in team_info.items():
+    for team_code, (full_name, location, others) in team_index.items():
         # Check full team name (e.g., "Los Angeles Lakers")
-        if info["full_name"].lower() in lower_tweet:
+        if full_name in lower_tweet:
             mentioned_teams.add(team_code)
             continue
 
         # Check location (e.g., "Los Angeles")
-        if info["location"].lower() in lower_tweet:
+        if location in lower_tweet:
             # Additional check to disambiguate shared locations (LA has two teams)
-            if info["location"].lower() == "los angeles":
+            if location == "los angeles":
                 # Check if specifically Lakers or Clippers is mentioned
                 if "lakers" in lower_tweet:
                     mentioned_teams.add("LAL")
@@ -225,25 +435,126 @@ def find_team_mentions(tweet_text, team_info):
                 mentioned_teams.add(team_code)
             continue
 
-        # Check nickname (e.g., "Lakers")
-        if info["nickname"].lower() in lower_tweet:
-            mentioned_teams.add(team_code)
-            continue
-
-        # Check abbreviation (e.g., "LAL")
-        if team_code.lower() in lower_tweet:
-            mentioned_teams.add(team_code)
-            continue
-
-        # Check alternate names and common references
-        for alt_name in info.get("alternates", []):
-            if alt_name.lower() in lower_tweet:
+        # Check nickname, abbreviation and alternate names (e.g., "Lakers", "LAL")
+        for alias in others:
+            if alias in lower_tweet:
                 mentioned_teams.add(team_code)
                 break
 
     return mentioned_teams
 
 
+# Roster, team data and their lookups used by _score_one, set once per
+# process by _init_worker
+_worker_context = None
+
+
+def _init_worker(all_players, player_teams, team_info):
+    """
+    Store the roster and team data once per worker process and build the
+    lookups there, so none of it is pickled per task.
+
+    Args:
+        all_players (tuple): All player names
+        player_teams (dict): Mapping of player names to their team codes
+        team_info (dict): Information about teams
+    """
+    global _worker_context
+    _worker_context = (
+        all_players,
+        player_teams,
+        team_info,
+        build_player_index(all_players),
+        build_team_index(team_info),
+        build_player_team_ids(all_players, player_teams, team_info),
+    )
+
+
+def _score_one(i, test, threshold, scorer, limit, matches):
+    """
+    Score a single test case; module level so worker processes can run it.
+
+    Args:
+        i (int): 1-based test case number
+        test (dict): The test case dictionary
+        threshold (int): Score threshold for matching
+        scorer (callable): Scoring function to use
+        limit (int): Maximum number of matches to return
+        matches (list): Precomputed matches for this tweet from extract_batch
+
+    Returns:
+        dict: The test case result
+    """
+    (
+        all_players,
+        player_teams,
+        team_info,
+        player_index,
+        team_index,
+        player_team_ids,
+    ) = _worker_context
+    tweet = test["tweet"]
+    expected = set(test.get("expected_matches", []))
+
+    # Find team mentions first for debugging
+    mentioned_teams = find_team_mentions(tweet, team_info, team_index)
+
+    start_time = time.perf_counter_ns()
+    matches, all_match_data = find_player_mentions_fuzzy(
+        tweet,
+        all_players,
+        player_teams,
+        team_info,
+        threshold,
+        scorer,
+        limit,
+        player_index=player_index,
+        matches=matches,
+        team_index=team_index,
+        player_team_ids=player_team_ids,
+    )
+    elapsed = (time.perf_counter_ns() - start_time) / 1e6  # convert to ms
+
+    # Determine if test passed
+    actual_set = set(matches)
+    passed = all(name in actual_set for name in expected)
+
+    return {
+        "id": i,
+        "passed": passed,
+        "tweet": tweet,
+        "expected": expected,
+        "actual": actual_set,
+        "teams_mentioned": mentioned_teams,
+        "all_matches": all_match_data,
+        "elapsed_ms": elapsed,
+    }
+
+
+_ROW_FMT = "  {name:<25} {score:>6.2f}  {idx:>3}  {status}"
+
+
+def _match_status(name, result):
+    """
+    Label one potential match for the results table.
+
+    Args:
+        name (str): The matched player name
+        result (dict): The test case result the match belongs to
+
+    Returns:
+        str: CORRECT MATCH / FALSE POSITIVE when the name was returned as a
+            match, FALSE NEGATIVE when it was expected but not, otherwise empty
+    """
+    if name in result["actual"]:
+        if name in result["expected"]:
+            return "✓ CORRECT MATCH"
+        return "! FALSE POSITIVE"
+    if name in result["expected"]:
+        return "! FALSE NEGATIVE"
+    return ""
+
+
 def run_test_cases(
     test_cases,
     all_players,
@@ -252,6 +563,7 @@ def run_test_cases(
     threshold=30,
     scorer=fuzz.token_set_ratio,
     limit=5,
+    workers=None,
 ):
     """
     Run a series of test cases and display the results.
@@ -264,78 +576,83 @@ def run_test_cases(
         threshold (int): Score threshold for matching
         scorer (callable): Scoring function to use
         limit (int): Maximum number of matches to return
+        workers (int): Number of processes to score test cases in; None or 1
+            scores them in this process, which is faster for small suites
     """
-    print(f"\n{'='*80}")
-    print(
+    # Collect output and write it once, rather than a print() per line
+    lines = []
+    lines.append(f"\n{'='*80}")
+    lines.append(
         f"FUZZY MATCHING TEST RESULTS (Threshold: {threshold}, Scorer: {scorer.__name__}, Limit: {limit})"
     )
-    print(f"{'='*80}")
+    lines.append(f"{'='*80}")
 
-    results = []
+    # Score all tweets in one batch; each case is charged an equal share
+    queries = [test["tweet"] for test in test_cases]
+    start_time = time.perf_counter_ns()
+    batch = extract_batch(queries, all_players, scorer)
+    batch_elapsed = (time.perf_counter_ns() - start_time) / 1e6 / max(len(queries), 1)
 
-    for i, test in enumerate(test_cases, 1):
-        tweet = test["tweet"]
-        expected = set(test.get("expected_matches", []))
+    score_args = (
+        range(1, len(test_cases) + 1),
+        test_cases,
+        repeat(threshold),
+        repeat(scorer),
+        repeat(limit),
+        batch,
+    )
+    init_args = (tuple(all_players), player_teams, team_info)
+    if workers and workers > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=init_args
+        ) as executor:
+            # Ship tweets in chunks of up to 64 to cut IPC round-trips, but
+            # small enough that a short suite still reaches every worker
+            chunksize = max(1, min(64, len(test_cases) // workers))
+            results = list(executor.map(_score_one, *score_args, chunksize=chunksize))
+    else:
+        _init_worker(*init_args)
+        results = list(map(_score_one, *score_args))
 
-        # Find team mentions first for debugging
-        mentioned_teams = find_team_mentions(tweet, team_info)
-
-        start_time = time.time()
-        matches, all_match_data = find_player_mentions_fuzzy(
-            tweet, all_players, player_teams, team_info, threshold, scorer, limit
-        )
-        elapsed = (time.time() - start_time) * 1000  # convert to ms
-
-        # Determine if test passed
-        actual_set = set(matches)
-        passed = all(name in actual_set for name in expected)
-
-        results.append(
-            {
-                "id": i,
-                "passed": passed,
-                "tweet": tweet,
-                "expected": expected,
-                "actual": actual_set,
-                "teams_mentioned": mentioned_teams,
-                "all_matches": all_match_data,
-                "elapsed_ms": elapsed,
-            }
-        )
+    for result in results:
+        result["elapsed_ms"] += batch_elapsed
 
     # Display results
     total_passed = sum(1 for r in results if r["passed"])
 
     for i, result in enumerate(results, 1):
-        print(f"\nTest Case #{i}: {'✓ PASSED' if result['passed'] else '✗ FAILED'}")
-        print(f"Tweet: \"{result['tweet']}\"")
+        lines.append(
+            f"\nTest Case #{i}: {'✓ PASSED' if result['passed'] else '✗ FAILED'}"
+        )
+        lines.append(f"Tweet: \"{result['tweet']}\"")
 
         if result["teams_mentioned"]:
-            print(f"Teams Mentioned: {result['teams_mentioned']}")
+            lines.append(f"Teams Mentioned: {result['teams_mentioned']}")
 
-        print("\nAll potential matches (Name, Score, Index):")
-        for name, score, idx in result["all_matches"]:
-            match_status = ""
-            if name in result["actual"]:
-                if name in result["expected"]:
-                    match_status = "✓ CORRECT MATCH"
-                else:
-                    match_status = "! FALSE POSITIVE"
-            elif name in result["expected"]:
-                match_status = "! FALSE NEGATIVE"
-
-            print(f"  {name:<25} {score:>6.2f}  {idx:>3}  {match_status}")
+        lines.append("\nAll potential matches (Name, Score, Index):")
+        lines.extend(
+            _ROW_FMT.format_map(
+                {
+                    "name": name,
+                    "score": score,
+                    "idx": idx,
+                    "status": _match_status(name, result),
+                }
+            )
+            for name, score, idx in result["all_matches"]
+        )
 
         if not result["passed"]:
-            print("\nExpected:", sorted(list(result["expected"])))
-            print("Actual:  ", sorted(list(result["actual"])))
+            lines.append(f"\nExpected: {sorted(result['expected'])}")
+            lines.append(f"Actual:   {sorted(result['actual'])}")
 
-        print(f"Time: {result['elapsed_ms']:.2f}ms")
-        print("-" * 80)
+        lines.append(f"Time: {result['elapsed_ms']:.2f}ms")
+        lines.append("-" * 80)
 
-    print(
+    lines.append(
         f"\nSummary: {total_passed}/{len(results)} tests passed ({total_passed/len(results)*100:.1f}%)"
     )
+    sys.stdout.write("\n".join(lines) + "\n")
     return results
 
 
@@ -695,10 +1012,13 @@ if __name__ == "__main__":
     print(f"Expected matches: {expected}")
 
     # First check team mentions
-    mentioned_teams = find_team_mentions(test_tweet, team_info)
+    team_index = build_team_index(team_info)
+    player_team_ids = build_player_team_ids(all_players, player_teams, team_info)
+    mentioned_teams = find_team_mentions(test_tweet, team_info, team_index)
     print(f"Teams mentioned: {mentioned_teams}")
 
-    start_time = time.time()
+    player_index = build_player_index(tuple(all_players))
+    start_time = time.perf_counter_ns()
     matches, all_match_data = find_player_mentions_fuzzy(
         test_tweet,
         all_players,
@@ -706,8 +1026,11 @@ if __name__ == "__main__":
         team_info,
         threshold=30,
         scorer=fuzz.token_set_ratio,
+        player_index=player_index,
+        team_index=team_index,
+        player_team_ids=player_team_ids,
     )
-    elapsed = (time.time() - start_time) * 1000
+    elapsed = (time.perf_counter_ns() - start_time) / 1e6
 
     print(f"\nMatches found: {matches}")
     print(f"Time taken: {elapsed:.2f}ms")